@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+from itertools import combinations
+import numpy as np
+from ampwrapper.fit import FitResults
+from ampwrapper.fit.engine import FitEngine
+
+def main():
+    """
+    Compares the FitEngine with AmpTools' FitResults on real .fit files
+
+    For each file, every amplitude on its own, every coherent sum, and every
+    reaction are queried as wave sets through both readers, along with the
+    phase difference of every pair of amplitudes in a reaction and every
+    production parameter. The intensities (with and without acceptance
+    correction), their errors, the phases and their errors, and the total
+    intensities must agree within --rtol (relative) or --atol (absolute),
+    otherwise the worst columns are listed and this exits with an error.
+    The engine should only be used for results (--use-engine) once this
+    passes on fits of the same kind.
+    """
+    parser = argparse.ArgumentParser(description="Checks that the FitEngine matches AmpTools' FitResults")
+    parser.add_argument("fit_files", nargs="+", help=".fit files written by AmpTools")
+    parser.add_argument("--rtol", type=float, default=1e-8, help="relative tolerance")
+    parser.add_argument("--atol", type=float, default=1e-10, help="absolute tolerance")
+    parser.add_argument("--top", type=int, default=5, help="number of worst columns to list per file")
+    args = parser.parse_args()
+    failed = []
+    for fit_file in args.fit_files:
+        differences = compare(fit_file)
+        worst = sorted(differences.items(), key=lambda item: item[1][0], reverse=True)
+        mismatched = [column for column, (_, abs_diff, reference) in differences.items()
+                      if abs_diff > args.atol + args.rtol * abs(reference)]
+        print(f"{fit_file}: {len(differences)} column(s), {len(mismatched)} mismatched")
+        for column, (rel_diff, abs_diff, reference) in worst[:args.top]:
+            print(f"    {column}: relative {rel_diff:.3g}, absolute {abs_diff:.3g} (AmpTools: {reference:.10g})")
+        if mismatched:
+            failed.append(fit_file)
+    if failed:
+        print(f"The engine doesn't match AmpTools for: {', '.join(failed)}")
+        sys.exit(1)
+
+def queries(amp_names):
+    """
+    The query_columns arguments which cover every amplitude, coherent sum,
+    reaction, and phase difference in a fit
+    """
+    intensities = {amp: [amp] for amp in amp_names}
+    groups = {}
+    for amp in amp_names:
+        reaction, coherent_sum, _ = amp.split("::")
+        groups.setdefault(f"{reaction}::{coherent_sum}", []).append(amp)
+        groups.setdefault(reaction, []).append(amp)
+    intensities.update(groups)
+    reactions = {}
+    for amp in amp_names:
+        reactions.setdefault(amp.split("::")[0], []).append(amp)
+    phases = {f"{amp1}|{amp2}@phase": (amp1, amp2)
+              for amps in reactions.values() for amp1, amp2 in combinations(amps, 2)}
+    return {"intensities": intensities, "amps": {f"{amp}@amp": amp for amp in amp_names},
+            "scaled_amps": {f"{amp}@scaled": amp for amp in amp_names}, "phases": phases}
+
+def compare(fit_file):
+    """
+    Returns {column: (relative difference, absolute difference, AmpTools value)}
+    """
+    wrapper = FitResults.FitResultsWrapper(str(fit_file))
+    engine = FitEngine(fit_file)
+    if sorted(wrapper.amp_names) != sorted(engine.amp_names):
+        print(f"{fit_file}: the amplitudes differ ({len(wrapper.amp_names)} from AmpTools, {len(engine.amp_names)} from the engine)")
+        return {"amp_names": (np.inf, np.inf, 0.0)}
+    query = queries(wrapper.amp_names)
+    expected = wrapper.query_columns(**query)
+    actual = engine.query_columns(**query)
+    differences = {}
+    for column, reference in expected.items():
+        if column.endswith("@phase"):
+            # phases can come out 2 pi apart
+            abs_diff = abs(np.angle(np.exp(1j * (actual[column] - reference))))
+        else:
+            abs_diff = abs(actual[column] - reference)
+        differences[column] = (abs_diff / abs(reference) if reference else abs_diff, abs_diff, abs(reference))
+    return differences
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+FAST_SCRIPTS = ["amptools-info", "amptools-link"]
+
+def main():
+    """
+    Times how long each amptools-* entry point takes to start
+
+    Only a script's top-level imports are run (in a fresh interpreter, the
+    best of --repeat runs), so this measures startup without needing an
+    environment, a study, or a terminal. The slowest modules of each script
+    are taken from python -X importtime. Exits with an error if any of the
+    --check scripts takes longer than --limit seconds.
+    """
+    parser = argparse.ArgumentParser(description="Measures the import time of every amptools-* entry point")
+    parser.add_argument("scripts", nargs="*", help="scripts to time (default: every script in setup.py)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="number of runs per script (the fastest is reported)")
+    parser.add_argument("--limit", type=float, default=0.5, help="maximum startup time in seconds for the --check scripts")
+    parser.add_argument("--check", nargs="*", default=FAST_SCRIPTS, help="scripts which must start within --limit")
+    parser.add_argument("--top", type=int, default=3, help="number of slowest imports to list per script")
+    args = parser.parse_args()
+    scripts = args.scripts or setup_scripts()
+    failed = []
+    print(f"{'script':36} {'time (s)':>9}  slowest imports")
+    for script in scripts:
+        seconds, slowest, error = time_imports(ROOT_DIR / "src" / "ampwrapper" / script, args.repeat, args.top)
+        if error:
+            print(f"{script:36} {'-':>9}  failed to import: {error}")
+        else:
+            print(f"{script:36} {seconds:9.3f}  {', '.join(f'{module} ({module_seconds:.2f})' for module, module_seconds in slowest)}")
+        if script in args.check and (error or seconds > args.limit):
+            failed.append(script)
+    if failed:
+        print(f"Slower than {args.limit} s (or failed): {', '.join(failed)}")
+        sys.exit(1)
+
+def setup_scripts():
+    return re.findall(r'SRC \+ "/([\w-]+)"', (ROOT_DIR / "setup.py").read_text())
+
+def import_code(script_path):
+    """
+    The top-level import statements of a script (including those inside
+    try blocks, like optional dependencies, whose except clauses are
+    dropped since they may use the rest of the script)
+    """
+    statements = []
+    for node in ast.parse(script_path.read_text()).body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(node)
+        elif isinstance(node, ast.Try) and any(isinstance(child, (ast.Import, ast.ImportFrom)) for child in node.body):
+            body = [child for child in node.body if isinstance(child, (ast.Import, ast.ImportFrom))]
+            handler = ast.ExceptHandler(type=ast.Name(id="ImportError", ctx=ast.Load()), name=None, body=[ast.Pass()])
+            statements.append(ast.Try(body=body, handlers=[handler], orelse=[], finalbody=[]))
+    return ast.unparse(ast.Module(body=statements, type_ignores=[]))
+
+def time_imports(script_path, repeat, top):
+    """
+    Returns (best wall time, [(module, seconds)] of the slowest top-level
+    imports, error message or None)
+    """
+    code = import_code(script_path)
+    # run against this checkout rather than an installed copy
+    python_path = os.pathsep.join(filter(None, [str(ROOT_DIR / "src"), os.environ.get("PYTHONPATH")]))
+    best = None
+    stderr = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True,
+                                env={**os.environ, "PYTHONPATH": python_path})
+        seconds = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, [], result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"exit code {result.returncode}"
+        if best is None or seconds < best:
+            best, stderr = seconds, result.stderr
+    return best, slowest_imports(stderr, top), None
+
+def slowest_imports(importtime_output, top):
+    # "import time: self [us] | cumulative | imported package", nested imports are indented
+    cumulative = {}
+    for line in importtime_output.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$", line)
+        if match:
+            cumulative[match.group(2)] = int(match.group(1)) / 1e6
+    return sorted(cumulative.items(), key=lambda item: item[1], reverse=True)[:top]
+
+if __name__ == "__main__":
+    main()
@@ -24,10 +24,12 @@ setup(
     packages=find_packages('src'),
     package_dir={"": "src"},
     scripts=[SRC + "/amptools-activate",
+             SRC + "/amptools-boost",
              SRC + "/amptools-convert",
              SRC + "/amptools-fit",
              SRC + "/amptools-fit-bootstrap",
              SRC + "/amptools-fit-chain",
+             SRC + "/amptools-fit-replicates",
              SRC + "/amptools-fit-stability",
              SRC + "/amptools-generate",
              SRC + "/amptools-generate-from-json",
@@ -58,7 +60,9 @@ setup(
         'matplotlib',
         'particle',
         'tqdm',
-        'uproot'
+        'uproot',
+        'awkward',
+        'pyarrow'
     ],
     zip_safe=False
 )
@@ -0,0 +1,325 @@
+import os
+import time
+import queue
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from tqdm import tqdm
+import ampwrapper.utils as amputils
+
+EXECUTORS = ["slurm", "local"]
+
+
+class FitJob:
+    """
+    One fit to run: a command (like ["fit", "-c", "<config>.cfg"]) run in a
+    directory
+
+    The SLURM backend submits one array job per group (named group, with
+    group_args passed to the dispatch script), since the dispatch script
+    itself loops over the fits in a group, and task is the job's index in
+    that array (None if the group isn't an array). The local backend runs
+    every command on its own, writing its output to <directory>/<log_name>.
+
+    Either way, the job's exit code is written to a sentinel file,
+    <directory>/<log stem>.exit, when it finishes. key and output are the
+    results key (like (bin, iteration)) and .fit file the job produces.
+    """
+
+    def __init__(self, name, directory, command, group=None, group_args=(), task=None,
+                 key=None, output=None, log_name="fit.log"):
+        self.name = name
+        self.directory = Path(directory)
+        self.command = [str(part) for part in command]
+        self.group = group if group is not None else name
+        self.group_args = [str(arg) for arg in group_args]
+        self.task = task
+        self.key = key
+        self.output = output
+        self.log_path = self.directory / log_name
+
+    @property
+    def exit_path(self):
+        return self.log_path.with_suffix(".exit")
+
+    def read_exit_code(self):
+        """
+        The exit code from the sentinel file, or None if the job hasn't finished
+        """
+        try:
+            return int(self.exit_path.read_text().strip() or -1)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def clear_exit_code(self):
+        if self.exit_path.exists():
+            self.exit_path.unlink()
+
+
+def sentinel_command(log_name="fit.log"):
+    """
+    The tcsh line a dispatch script runs after a fit to write its sentinel file
+    """
+    return f"echo $status > {Path(log_name).with_suffix('.exit')}\n"
+
+
+def report_progress(jobs, finished, extra=""):
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job.group, []).append(job.name in finished)
+    groups_done = sum(all(done) for done in groups.values())
+    print(f"{len(finished):5}/{len(jobs)} fit(s) done | {groups_done:4}/{len(groups)} bin(s) complete{extra}", end="\r")
+
+
+class CompletionBatcher:
+    """
+    Passes finished jobs on to an on_complete callback in batches, once
+    max_jobs have finished or max_seconds have passed since the last batch
+
+    Collecting a batch reads the manifest and writes part files in the
+    results store, so doing that for every single fit of a large scan would
+    rewrite the manifest once per fit and leave thousands of tiny parts.
+    """
+
+    def __init__(self, on_complete, max_jobs=100, max_seconds=30.0):
+        self.on_complete = on_complete
+        self.max_jobs = max_jobs
+        self.max_seconds = max_seconds
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+    def add(self, jobs):
+        self.pending.extend(jobs)
+        if len(self.pending) >= self.max_jobs or time.monotonic() - self.last_flush >= self.max_seconds:
+            self.flush()
+
+    def flush(self):
+        if self.pending and self.on_complete:
+            self.on_complete(self.pending)
+        self.pending = []
+        self.last_flush = time.monotonic()
+
+
+# sacct states of jobs which have left the queue for good
+FINISHED_STATES = {"COMPLETED", "FAILED", "CANCELLED", "TIMEOUT", "OUT_OF_MEMORY", "NODE_FAIL",
+                   "PREEMPTED", "BOOT_FAIL", "DEADLINE", "REVOKED"}
+
+
+class JobTracker:
+    """
+    Waits for submitted SLURM jobs, reporting each one as it finishes
+
+    A job is finished when its sentinel file appears. One squeue call per
+    check (for all the submitted job IDs at once) catches jobs which left
+    the queue without writing one (like jobs which were cancelled or hit
+    their time limit). If squeue fails, sacct is asked which jobs have
+    finished instead, and after max_failures checks in a row without a
+    working squeue, the jobs still without a sentinel are given up on as
+    failed. Checks start every min_interval seconds and back off to
+    max_interval while nothing changes.
+    """
+
+    def __init__(self, jobs, job_ids, min_interval=2.0, max_interval=30.0, max_failures=20):
+        self.jobs = jobs
+        self.job_ids = job_ids # group -> SLURM job ID
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_failures = max_failures
+
+    def slurm_states(self):
+        """
+        Returns {"<id>" or "<id>_<task>": state} for every queued job, or
+        None if squeue failed (so nothing is assumed to have left the queue)
+        """
+        if not self.job_ids:
+            return {}
+        result = subprocess.run(['squeue', '-h', '-r', '-j', ",".join(self.job_ids.values()), '-o', '%i %T'],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        if result.returncode != 0:
+            return None
+        return dict(line.split()[:2] for line in result.stdout.decode('utf-8').splitlines() if len(line.split()) >= 2)
+
+    def sacct_finished(self):
+        """
+        Returns the "<id>" or "<id>_<task>" of every job sacct knows has
+        finished (empty if sacct isn't available)
+        """
+        if not self.job_ids:
+            return set()
+        try:
+            result = subprocess.run(['sacct', '-n', '-X', '-P', '-j', ",".join(self.job_ids.values()), '-o', 'JobID,State'],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError:
+            return set()
+        if result.returncode != 0:
+            return set()
+        finished = set()
+        for line in result.stdout.decode('utf-8').splitlines():
+            job_id, _, state = line.partition("|")
+            if state.split() and state.split()[0] in FINISHED_STATES: # like "CANCELLED by 1234"
+                finished.add(job_id)
+        return finished
+
+    def slurm_id(self, job):
+        job_id = self.job_ids.get(job.group)
+        if job_id is None:
+            return None
+        return job_id if job.task is None else f"{job_id}_{job.task}"
+
+    def wait(self, on_complete=None):
+        """
+        Blocks until every job has finished, calling on_complete with
+        batches of newly finished jobs, and returns {name: exit code} (None
+        for jobs which never wrote a sentinel)
+        """
+        returncodes = {}
+        pending = list(self.jobs)
+        interval = self.min_interval
+        queue_status = ""
+        n_failures = 0 # squeue failures in a row
+        batcher = CompletionBatcher(on_complete)
+        while pending:
+            states = self.slurm_states() # before the sentinels, so a job can't finish in between unnoticed
+            finished_ids = set()
+            if states is None:
+                n_failures += 1
+                finished_ids = self.sacct_finished()
+            else:
+                n_failures = 0
+            give_up = n_failures >= self.max_failures
+            if give_up:
+                print(amputils.wrap(f"squeue failed {n_failures} times in a row, treating the jobs without a sentinel file as failed"))
+            newly_finished = []
+            still_pending = []
+            for job in pending:
+                returncode = job.read_exit_code()
+                slurm_id = self.slurm_id(job)
+                left_queue = (states is not None and slurm_id not in states) or slurm_id in finished_ids
+                if returncode is not None or left_queue or give_up:
+                    returncodes[job.name] = returncode
+                    newly_finished.append(job)
+                else:
+                    still_pending.append(job)
+            pending = still_pending
+            if states is not None:
+                n_running = sum(state == "RUNNING" for state in states.values())
+                queue_status = f" | {len(states):4} job(s) in queue | {n_running:4} job(s) running"
+            report_progress(self.jobs, returncodes, queue_status)
+            if newly_finished:
+                batcher.add(newly_finished)
+                interval = self.min_interval
+            else:
+                interval = min(interval * 1.5, self.max_interval)
+            if pending:
+                time.sleep(interval)
+        batcher.flush()
+        print()
+        return returncodes
+
+
+class SlurmExecutor:
+    """
+    Submits each group of jobs with sbatch and tracks them until they finish
+    """
+
+    def __init__(self, slurm_path):
+        self.slurm_path = Path(slurm_path)
+
+    def run(self, jobs, on_complete=None):
+        groups = {}
+        tasks = {}
+        for job in jobs:
+            job.clear_exit_code()
+            groups.setdefault(job.group, job.group_args)
+            if job.task is not None:
+                tasks.setdefault(job.group, set()).add(job.task)
+        job_ids = {}
+        for group, group_args in tqdm(groups.items()):
+            # submit exactly the tasks being run, whatever the dispatch script's --array says
+            array = ["--array", ",".join(str(task) for task in sorted(tasks[group]))] if group in tasks else []
+            result = subprocess.run(["sbatch", "--parsable", "-J", group, *array, str(self.slurm_path), *group_args],
+                                    stdout=subprocess.PIPE)
+            job_id = result.stdout.decode('utf-8').strip().split(";")[0]
+            if result.returncode != 0 or not job_id:
+                print(amputils.wrap(f"Failed to submit {group}!"))
+                continue
+            job_ids[group] = job_id
+        return JobTracker(jobs, job_ids).wait(on_complete)
+
+
+class LocalExecutor:
+    """
+    Runs jobs on this machine, at most max_workers at a time
+
+    The available CPUs are split evenly between the workers and each job is
+    pinned to its worker's share (OMP_NUM_THREADS is set to match), so
+    concurrent fits don't compete for cores.
+    """
+
+    def __init__(self, max_workers=None, pin_cpus=True):
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+        self.max_workers = max(1, min(max_workers or len(cpus), len(cpus)))
+        threads = len(cpus) // self.max_workers
+        self.cpu_sets = [cpus[i * threads:(i + 1) * threads] for i in range(self.max_workers)]
+        self.pin_cpus = pin_cpus and hasattr(os, "sched_setaffinity")
+
+    def run_job(self, job, free_slots):
+        slot = free_slots.get()
+        try:
+            cpu_set = self.cpu_sets[slot]
+            env = dict(os.environ, OMP_NUM_THREADS=str(len(cpu_set)))
+            with open(job.log_path, 'w') as log_file:
+                try:
+                    process = subprocess.Popen(job.command, cwd=job.directory, stdout=log_file,
+                                               stderr=subprocess.STDOUT, env=env)
+                except OSError as error: # e.g. the fit executable isn't on the PATH
+                    log_file.write(f"{error}\n")
+                    returncode = 127
+                else:
+                    # pinned from here rather than with preexec_fn, which can deadlock the child when
+                    # other threads are running (the fit's own threads start later and inherit the mask)
+                    if self.pin_cpus:
+                        try:
+                            os.sched_setaffinity(process.pid, cpu_set)
+                        except ProcessLookupError: # already finished
+                            pass
+                    returncode = process.wait()
+            job.exit_path.write_text(f"{returncode}\n")
+            return returncode
+        finally:
+            free_slots.put(slot)
+
+    def run(self, jobs, on_complete=None):
+        for job in jobs:
+            job.clear_exit_code()
+        free_slots = queue.Queue()
+        for slot in range(self.max_workers):
+            free_slots.put(slot)
+        returncodes = {}
+        batcher = CompletionBatcher(on_complete)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self.run_job, job, free_slots): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                returncodes[job.name] = future.result()
+                report_progress(jobs, returncodes)
+                batcher.add([job])
+        batcher.flush()
+        print()
+        failed = [job for job in jobs if returncodes[job.name] != 0]
+        if failed:
+            print(f"{len(failed)} of {len(jobs)} fit(s) exited with an error:")
+            for job in failed:
+                print(f"    {job.name} (exit code {returncodes[job.name]}): {job.log_path}")
+        return returncodes
+
+
+def add_executor_arguments(parser):
+    parser.add_argument("--executor", choices=EXECUTORS, default="slurm", help="run fits through SLURM or as local processes")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of fits to run at once with --executor local (default: one per CPU)")
+    parser.add_argument("--no-pin", action="store_true", help="don't pin local fits to their own CPUs")
+
+def get_executor(args, slurm_path):
+    if args.executor == "local":
+        return LocalExecutor(args.jobs, pin_cpus=not args.no_pin)
+    return SlurmExecutor(slurm_path)
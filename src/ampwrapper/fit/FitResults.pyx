@@ -6,6 +6,7 @@ from libcpp.complex cimport complex
 import os
 import sys
 from contextlib import contextmanager
+import numpy as np
 
 cdef extern from "FitResults.h":
     cdef cppclass FitResults:
@@ -62,6 +63,64 @@ cdef class CyFitResults:
     def parError(self, par):
         return self.cobj.parError(par)
 
+    def batch(self, list wave_sets, list amps, list scaled_amps, list pars, list phase_pairs):
+        """
+        Evaluates everything in one pass over the C++ object (all names must
+        already be encoded as bytes)
+        """
+        cdef Py_ssize_t i
+        cdef pair[double, double] result
+        cdef complex[double] value
+        cdef vector[string] wave_set
+        cdef string name
+        intensities = np.empty((len(wave_sets), 4), dtype=np.float64)
+        productions = np.empty((len(amps), 2), dtype=np.float64)
+        scaled_productions = np.empty((len(scaled_amps), 2), dtype=np.float64)
+        parameters = np.empty((len(pars), 2), dtype=np.float64)
+        phases = np.empty((len(phase_pairs), 2), dtype=np.float64)
+        totals = np.empty(4, dtype=np.float64)
+        cdef double[:, ::1] intensities_view = intensities
+        cdef double[:, ::1] productions_view = productions
+        cdef double[:, ::1] scaled_productions_view = scaled_productions
+        cdef double[:, ::1] parameters_view = parameters
+        cdef double[:, ::1] phases_view = phases
+        cdef double[::1] totals_view = totals
+        for i in range(len(wave_sets)):
+            wave_set = wave_sets[i]
+            result = self.cobj.intensity(wave_set, False)
+            intensities_view[i, 0] = result.first
+            intensities_view[i, 1] = result.second
+            result = self.cobj.intensity(wave_set, True)
+            intensities_view[i, 2] = result.first
+            intensities_view[i, 3] = result.second
+        for i in range(len(amps)):
+            name = amps[i]
+            value = self.cobj.productionParameter(name)
+            productions_view[i, 0] = value.real()
+            productions_view[i, 1] = value.imag()
+        for i in range(len(scaled_amps)):
+            name = scaled_amps[i]
+            value = self.cobj.scaledProductionParameter(name)
+            scaled_productions_view[i, 0] = value.real()
+            scaled_productions_view[i, 1] = value.imag()
+        for i in range(len(pars)):
+            name = pars[i]
+            parameters_view[i, 0] = self.cobj.parValue(name)
+            parameters_view[i, 1] = self.cobj.parError(name)
+        for i in range(len(phase_pairs)):
+            amp1, amp2 = phase_pairs[i]
+            result = self.cobj.phaseDiff(amp1, amp2)
+            phases_view[i, 0] = result.first
+            phases_view[i, 1] = result.second
+        result = self.cobj.total_intensity(False)
+        totals_view[0] = result.first
+        totals_view[1] = result.second
+        result = self.cobj.total_intensity(True)
+        totals_view[2] = result.first
+        totals_view[3] = result.second
+        return (intensities, productions, scaled_productions, parameters, phases,
+                totals, self.cobj.likelihood())
+
 
 @contextmanager
 def stdout_redirected(to=os.devnull):
@@ -98,6 +157,104 @@ def stdout_redirected(to=os.devnull):
 class FitResultsWrapper:
     def __init__(self, inFileStr):
         self.fitobj = CyFitResults(inFileStr.encode('utf-8'))
+        self._amp_names = None
+        self._par_names = None
+
+    @property
+    def amp_names(self):
+        """
+        Decoded amplitude names (read from the fit once)
+        """
+        if self._amp_names is None:
+            self._amp_names = [s.decode() for s in self.ampList()]
+        return self._amp_names
+
+    @property
+    def par_names(self):
+        """
+        Decoded parameter names (read from the fit once)
+        """
+        if self._par_names is None:
+            self._par_names = [s.decode() for s in self.parNameList()]
+        return self._par_names
+
+    def query(self, wave_sets=(), amps=(), scaled_amps=(), pars=(), phase_pairs=()):
+        """
+        Evaluates many quantities at once under a single stdout redirect
+
+        wave_sets is a list of amplitude lists, amps and scaled_amps are lists
+        of amplitude names, pars is a list of parameter names, and phase_pairs
+        is a list of (amp1, amp2) tuples. Returns a dict of NumPy arrays in
+        the same order as the inputs:
+            "int", "int@err", "int@acc", "int@acc@err": one value per wave set
+            "amp", "amp_scaled": complex production parameters
+            "par", "par@err": parameter values and errors
+            "phase", "phase@err": phase differences
+            "total@int", "total@int@err", "total@int@acc", "total@int@acc@err": floats
+            "likelihood": float
+        """
+        wave_sets = [[amp.encode('utf-8') for amp in wave_set] for wave_set in wave_sets]
+        amps = [amp.encode('utf-8') for amp in amps]
+        scaled_amps = [amp.encode('utf-8') for amp in scaled_amps]
+        pars = [par.encode('utf-8') for par in pars]
+        phase_pairs = [(amp1.encode('utf-8'), amp2.encode('utf-8')) for amp1, amp2 in phase_pairs]
+        with stdout_redirected():
+            intensities, productions, scaled_productions, parameters, phases, totals, likelihood = \
+                self.fitobj.batch(wave_sets, amps, scaled_amps, pars, phase_pairs)
+        return {
+            "int": intensities[:, 0],
+            "int@err": intensities[:, 1],
+            "int@acc": intensities[:, 2],
+            "int@acc@err": intensities[:, 3],
+            "amp": productions[:, 0] + 1j * productions[:, 1],
+            "amp_scaled": scaled_productions[:, 0] + 1j * scaled_productions[:, 1],
+            "par": parameters[:, 0],
+            "par@err": parameters[:, 1],
+            "phase": phases[:, 0],
+            "phase@err": phases[:, 1],
+            "total@int": totals[0],
+            "total@int@err": totals[1],
+            "total@int@acc": totals[2],
+            "total@int@acc@err": totals[3],
+            "likelihood": likelihood,
+        }
+
+    def query_columns(self, intensities=None, amps=None, scaled_amps=None, pars=None, phases=None):
+        """
+        Like query, but each argument is a dict mapping a result column to its
+        input, and the result is a flat dict of columns:
+            intensities {column: wave_set} -> column, column@err, column@acc, column@acc@err
+            amps, scaled_amps {column: amp} -> column
+            pars {column: par} -> column, column@err
+            phases {column: (amp1, amp2)} -> column, column@err
+        along with the total@int columns and likelihood
+        """
+        intensities = intensities or {}
+        amps = amps or {}
+        scaled_amps = scaled_amps or {}
+        pars = pars or {}
+        phases = phases or {}
+        values = self.query(list(intensities.values()), list(amps.values()), list(scaled_amps.values()),
+                            list(pars.values()), list(phases.values()))
+        columns = {}
+        for i, column in enumerate(intensities):
+            columns[column] = values["int"][i]
+            columns[column + "@err"] = values["int@err"][i]
+            columns[column + "@acc"] = values["int@acc"][i]
+            columns[column + "@acc@err"] = values["int@acc@err"][i]
+        for i, column in enumerate(amps):
+            columns[column] = values["amp"][i]
+        for i, column in enumerate(scaled_amps):
+            columns[column] = values["amp_scaled"][i]
+        for i, column in enumerate(pars):
+            columns[column] = values["par"][i]
+            columns[column + "@err"] = values["par@err"][i]
+        for i, column in enumerate(phases):
+            columns[column] = values["phase"][i]
+            columns[column + "@err"] = values["phase@err"][i]
+        for column in ["total@int", "total@int@err", "total@int@acc", "total@int@acc@err", "likelihood"]:
+            columns[column] = values[column]
+        return columns
 
     def likelihood(self):
         with stdout_redirected():
@@ -0,0 +1,220 @@
+import re
+from pathlib import Path
+import numpy as np
+
+COMPLEX_PATTERN = re.compile(r"\(([^,()]+),([^,()]+)\)")
+
+
+def parse_complex_row(line):
+    return [complex(float(re_part), float(im_part)) for re_part, im_part in COMPLEX_PATTERN.findall(line)]
+
+
+class FitEngine:
+    """
+    Computes intensities and phase differences straight from a .fit file
+
+    The file is parsed once for the production parameters, their covariance
+    matrix, and the normalization integrals of each reaction, after which any
+    number of wave sets are evaluated as matrix operations with the same
+    formulas AmpTools' FitResults uses:
+        intensity = sum_ij Re(s_i V_i s_j V_j* N_ij)
+    where s are the amplitude scales, V the production parameters, and N the
+    generated (acceptance corrected) or accepted normalization integrals, with
+    errors propagated through the covariance of the Re/Im production
+    parameters. Only amplitudes in the same reaction interfere.
+
+    This has the same amp_names, par_names, query, and query_columns interface
+    as FitResults.FitResultsWrapper, so either can be used to read a fit.
+    """
+
+    def __init__(self, fit_path):
+        self.fit_path = Path(fit_path)
+        self.reactions = {} # reaction -> list of amplitude names
+        self.amp_scales = {} # amplitude name -> scale (number or [parameter])
+        self.par_names = []
+        self.par_values = np.empty(0)
+        self.covariance = np.empty((0, 0))
+        self.likelihood = np.nan
+        sections = self.read_sections()
+        self.parse_amplitudes(sections.get("Reactions, Amplitudes, and Scale Parameters", []))
+        likelihood_lines = sections.get("Likelihood Total and Partial Sums", [])
+        if likelihood_lines:
+            self.likelihood = float(likelihood_lines[0].split()[0])
+        self.parse_parameters(sections.get("Parameter Values and Errors", []))
+        normalization = self.parse_normalization(sections.get("Normalization Integrals", []))
+        self.build_matrices(normalization)
+
+    def read_sections(self):
+        sections = {}
+        current = None
+        with open(self.fit_path, 'r') as fit_file:
+            for line in fit_file:
+                line = line.strip()
+                if line.startswith("+++"):
+                    current = line.strip("+ ")
+                    sections[current] = []
+                elif line and current is not None:
+                    sections[current].append(line)
+        return sections
+
+    def parse_amplitudes(self, lines):
+        lines = iter(lines)
+        n_reactions = int(next(lines).split()[0])
+        for _ in range(n_reactions):
+            reaction, n_amps = next(lines).split()[:2]
+            self.reactions[reaction] = []
+            for _ in range(int(n_amps)):
+                tokens = next(lines).split()
+                self.reactions[reaction].append(tokens[0])
+                self.amp_scales[tokens[0]] = tokens[1] if len(tokens) > 1 else "1.0"
+
+    def parse_parameters(self, lines):
+        n_pars = int(lines[0].split()[0])
+        self.par_names = [line.split()[0] for line in lines[1:n_pars + 1]]
+        self.par_values = np.array([float(line.split()[1]) for line in lines[1:n_pars + 1]])
+        self.covariance = np.array([[float(value) for value in line.split()]
+                                    for line in lines[n_pars + 1:2 * n_pars + 1]]).reshape(n_pars, n_pars)
+        self.par_index = {name: i for i, name in enumerate(self.par_names)}
+
+    def parse_normalization(self, lines):
+        normalization = {}
+        lines = iter(lines)
+        for line in lines:
+            reaction = line.split()[0]
+            next(lines) # number of generated and accepted events
+            n_amps = int(next(lines).split()[0])
+            names = [next(lines).split()[0] for _ in range(n_amps)]
+            generated = np.array([parse_complex_row(next(lines)) for _ in range(n_amps)])
+            accepted = np.array([parse_complex_row(next(lines)) for _ in range(n_amps)])
+            normalization[reaction] = (names, generated, accepted) # generated integrals come first
+        return normalization
+
+    def scale_value(self, amp):
+        scale = self.amp_scales.get(amp, "1.0")
+        if scale.startswith("[") and scale.endswith("]"):
+            return self.par_values[self.par_index[scale[1:-1]]]
+        return float(scale)
+
+    def build_matrices(self, normalization):
+        """
+        Lays every amplitude out on one axis, so the integrals of all the
+        reactions form a block diagonal matrix
+        """
+        self.amp_names = [amp for amps in self.reactions.values() for amp in amps]
+        self.amp_index = {amp: i for i, amp in enumerate(self.amp_names)}
+        n_amps = len(self.amp_names)
+        self.re_index = np.array([self.par_index[f"{amp}_re"] for amp in self.amp_names], dtype=int)
+        self.im_index = np.array([self.par_index[f"{amp}_im"] for amp in self.amp_names], dtype=int)
+        self.production = self.par_values[self.re_index] + 1j * self.par_values[self.im_index]
+        self.scales = np.array([self.scale_value(amp) for amp in self.amp_names])
+        self.scaled_production = self.scales * self.production
+        self.generated = np.zeros((n_amps, n_amps), dtype=complex)
+        self.accepted = np.zeros((n_amps, n_amps), dtype=complex)
+        for names, generated, accepted in normalization.values():
+            rows = [self.amp_index.get(name) for name in names]
+            keep = [i for i, row in enumerate(rows) if row is not None]
+            rows = np.array([rows[i] for i in keep], dtype=int)
+            self.generated[np.ix_(rows, rows)] = generated[np.ix_(keep, keep)]
+            self.accepted[np.ix_(rows, rows)] = accepted[np.ix_(keep, keep)]
+        # covariance of (Re V_0, ..., Re V_n, Im V_0, ..., Im V_n)
+        production_index = np.concatenate([self.re_index, self.im_index])
+        self.production_covariance = self.covariance[np.ix_(production_index, production_index)]
+
+    def wave_set_mask(self, wave_sets):
+        mask = np.zeros((len(wave_sets), len(self.amp_names)))
+        for k, wave_set in enumerate(wave_sets):
+            mask[k, [self.amp_index[amp] for amp in wave_set]] = 1.0
+        return mask
+
+    def intensities(self, wave_sets, acc):
+        """
+        Returns the intensities and errors of a list of wave sets as arrays
+        (acc selects the acceptance-corrected, generated integrals)
+        """
+        integrals = self.generated if acc else self.accepted
+        mask = self.wave_set_mask(wave_sets)
+        weighted = mask * self.scaled_production # (sets, amps)
+        # gradient[k, i] = sum_j N_ij conj(s_j V_j) over amplitudes j in set k
+        gradient = weighted.conj() @ integrals.T
+        values = np.einsum('ki,ki->k', weighted, gradient).real
+        # derivatives with respect to the unscaled Re V_i and Im V_i
+        scale = 2 * mask * self.scales
+        derivatives = np.concatenate([scale * gradient.real, -scale * gradient.imag], axis=1)
+        variances = np.einsum('kp,pq,kq->k', derivatives, self.production_covariance, derivatives)
+        return values, np.sqrt(np.maximum(variances, 0))
+
+    def phase_diffs(self, phase_pairs):
+        """
+        Returns arg(V_1 / V_2) and its error for a list of (amp1, amp2) pairs
+        """
+        first = np.array([self.amp_index[amp1] for amp1, _ in phase_pairs], dtype=int)
+        second = np.array([self.amp_index[amp2] for _, amp2 in phase_pairs], dtype=int)
+        v1 = self.production[first]
+        v2 = self.production[second]
+        values = np.angle(v1 / v2)
+        norm1 = np.abs(v1)**2
+        norm2 = np.abs(v2)**2
+        derivatives = np.stack([-v1.imag / norm1, v1.real / norm1, v2.imag / norm2, -v2.real / norm2], axis=1)
+        index = np.stack([self.re_index[first], self.im_index[first], self.re_index[second], self.im_index[second]], axis=1)
+        covariance = self.covariance[index[:, :, None], index[:, None, :]] # (pairs, 4, 4)
+        variances = np.einsum('kp,kpq,kq->k', derivatives, covariance, derivatives)
+        return values, np.sqrt(np.maximum(variances, 0))
+
+    def query(self, wave_sets=(), amps=(), scaled_amps=(), pars=(), phase_pairs=()):
+        """
+        Same as FitResultsWrapper.query
+        """
+        wave_sets = list(wave_sets)
+        all_amps = [self.amp_names]
+        values, errors = self.intensities(wave_sets + all_amps, False)
+        acc_values, acc_errors = self.intensities(wave_sets + all_amps, True)
+        phases, phase_errors = self.phase_diffs(list(phase_pairs))
+        par_index = np.array([self.par_index[par] for par in pars], dtype=int)
+        return {
+            "int": values[:-1],
+            "int@err": errors[:-1],
+            "int@acc": acc_values[:-1],
+            "int@acc@err": acc_errors[:-1],
+            "amp": self.production[np.array([self.amp_index[amp] for amp in amps], dtype=int)],
+            "amp_scaled": self.scaled_production[np.array([self.amp_index[amp] for amp in scaled_amps], dtype=int)],
+            "par": self.par_values[par_index],
+            "par@err": np.sqrt(np.maximum(np.diag(self.covariance)[par_index], 0)),
+            "phase": phases,
+            "phase@err": phase_errors,
+            "total@int": values[-1],
+            "total@int@err": errors[-1],
+            "total@int@acc": acc_values[-1],
+            "total@int@acc@err": acc_errors[-1],
+            "likelihood": self.likelihood,
+        }
+
+    def query_columns(self, intensities=None, amps=None, scaled_amps=None, pars=None, phases=None):
+        """
+        Same as FitResultsWrapper.query_columns
+        """
+        intensities = intensities or {}
+        amps = amps or {}
+        scaled_amps = scaled_amps or {}
+        pars = pars or {}
+        phases = phases or {}
+        values = self.query(list(intensities.values()), list(amps.values()), list(scaled_amps.values()),
+                            list(pars.values()), list(phases.values()))
+        columns = {}
+        for i, column in enumerate(intensities):
+            columns[column] = values["int"][i]
+            columns[column + "@err"] = values["int@err"][i]
+            columns[column + "@acc"] = values["int@acc"][i]
+            columns[column + "@acc@err"] = values["int@acc@err"][i]
+        for i, column in enumerate(amps):
+            columns[column] = values["amp"][i]
+        for i, column in enumerate(scaled_amps):
+            columns[column] = values["amp_scaled"][i]
+        for i, column in enumerate(pars):
+            columns[column] = values["par"][i]
+            columns[column + "@err"] = values["par@err"][i]
+        for i, column in enumerate(phases):
+            columns[column] = values["phase"][i]
+            columns[column + "@err"] = values["phase@err"][i]
+        for column in ["total@int", "total@int@err", "total@int@acc", "total@int@acc@err", "likelihood"]:
+            columns[column] = values[column]
+        return columns
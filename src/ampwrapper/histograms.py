@@ -0,0 +1,162 @@
+from pathlib import Path
+import numpy as np
+import uproot
+from ampwrapper.kinematics import iterate_angles
+from ampwrapper.utils import load_cached_arrays, save_cached_arrays
+
+MASS_BIN_WIDTH = 0.001 # GeV, the smallest edge increment in get_binning
+N_ANGLE_BINS = 240 # divisible by most histogram bin counts (2-6, 8, 10, 12, 15, 16, 20, 24, 30, ...)
+ANGLE_RANGES = {"costheta": (-1.0, 1.0), "phi": (-np.pi, np.pi)}
+
+
+def rebin(counts, fine_edges, edges):
+    """
+    Merges fine bins (along the last axis of counts) into the bins between
+    edges
+
+    Coarse edges which fall inside a fine bin take a linear share of it, so
+    the result is exact whenever every coarse edge is also a fine edge.
+    """
+    counts = np.asarray(counts, dtype=float)
+    cumulative = np.concatenate([np.zeros(counts.shape[:-1] + (1,)), np.cumsum(counts, axis=-1)], axis=-1)
+    flat = cumulative.reshape(-1, cumulative.shape[-1])
+    at_edges = np.array([np.interp(edges, fine_edges, row) for row in flat])
+    return np.diff(at_edges, axis=-1).reshape(counts.shape[:-1] + (len(edges) - 1,))
+
+
+def angle_edges(name):
+    low, high = ANGLE_RANGES[name]
+    return np.linspace(low, high, N_ANGLE_BINS + 1)
+
+
+class MassHistogram:
+    """
+    Weighted (row 0) and unweighted (row 1) counts of M_FinalState in
+    MASS_BIN_WIDTH bins, where bin i covers [(start + i) * width, (start + i + 1) * width)
+
+    The bins are aligned to multiples of the width rather than to the data,
+    so histograms of different files can be added bin by bin.
+    """
+
+    def __init__(self, start=0, counts=None):
+        self.start = int(start)
+        self.counts = np.zeros((2, 0)) if counts is None else np.asarray(counts, dtype=float)
+
+    @property
+    def edges(self):
+        return (self.start + np.arange(self.counts.shape[1] + 1)) * MASS_BIN_WIDTH
+
+    def extend(self, start, stop):
+        # grow the bins to cover [start, stop)
+        start = min(start, self.start) if self.counts.shape[1] else start
+        stop = max(stop, self.start + self.counts.shape[1]) if self.counts.shape[1] else stop
+        counts = np.zeros((2, stop - start))
+        counts[:, self.start - start:self.start - start + self.counts.shape[1]] = self.counts
+        self.start, self.counts = start, counts
+
+    def fill(self, masses, weights):
+        in_range = np.isfinite(masses) & np.isfinite(weights)
+        masses = masses[in_range]
+        indices = np.floor(masses / MASS_BIN_WIDTH).astype(np.int64)
+        if len(indices) == 0:
+            return
+        # m / width can round across an edge (0.3 / 0.001 = 299.99...), so compare against the edges themselves
+        indices += masses >= (indices + 1) * MASS_BIN_WIDTH
+        indices -= masses < indices * MASS_BIN_WIDTH
+        self.extend(int(indices.min()), int(indices.max()) + 1)
+        indices -= self.start
+        self.counts[0] += np.bincount(indices, weights=weights[in_range], minlength=self.counts.shape[1])
+        self.counts[1] += np.bincount(indices, minlength=self.counts.shape[1])
+
+    def __iadd__(self, other):
+        if other.counts.shape[1]:
+            self.extend(other.start, other.start + other.counts.shape[1])
+            offset = other.start - self.start
+            self.counts[:, offset:offset + other.counts.shape[1]] += other.counts
+        return self
+
+    def range(self):
+        """
+        The lower edge of the first and upper edge of the last non-empty bin
+        """
+        filled = np.flatnonzero(self.counts[1])
+        return (self.start + filled[0]) * MASS_BIN_WIDTH, (self.start + filled[-1] + 1) * MASS_BIN_WIDTH
+
+    def rebin(self, edges):
+        """
+        Returns the (weighted, unweighted) counts between edges
+        """
+        return tuple(rebin(self.counts, self.edges, edges))
+
+
+def mass_histogram(file_paths, step_size="100 MB"):
+    histogram = MassHistogram()
+    for file_path in file_paths:
+        with uproot.open(file_path) as tfile:
+            for chunk in tfile['kin'].iterate(['M_FinalState', 'Weight'], step_size=step_size, library='np'):
+                histogram.fill(chunk['M_FinalState'].astype(float), chunk['Weight'].astype(float))
+    return histogram
+
+
+def has_angles(file_paths):
+    """
+    Whether the helicity angles are defined for these flat trees, which
+    needs a recoil and two daughters (NumFinalState == 3, read from the
+    first event found)
+    """
+    for file_path in file_paths:
+        with uproot.open(file_path) as tfile:
+            n_final_state = tfile['kin']['NumFinalState'].array(entry_stop=1, library='np')
+        if len(n_final_state):
+            return int(n_final_state[0]) == 3
+    return True
+
+
+def angle_histograms(file_paths, step_size="100 MB"):
+    """
+    Returns {"costheta": counts, "phi": counts} for the helicity angles in the
+    given files, with weighted (row 0) and unweighted (row 1) counts in
+    N_ANGLE_BINS bins
+    """
+    histograms = {name: np.zeros((2, N_ANGLE_BINS)) for name in ANGLE_RANGES}
+    for chunk in iterate_angles(file_paths, step_size):
+        for name in ANGLE_RANGES:
+            edges = angle_edges(name)
+            histograms[name][0] += np.histogram(chunk[name], bins=edges, weights=chunk['weight'])[0]
+            histograms[name][1] += np.histogram(chunk[name], bins=edges)[0]
+    return histograms
+
+
+class StudyHistograms:
+    """
+    Fine-binned mass and angle histograms for a study, cached in
+    <study>/histograms
+
+    Mass histograms (<TYPE>_mass.npz) cover a file type's input files and
+    angle histograms (<TYPE>_<bin>.npz) its split files in one bin. Each is
+    built once and then read back until the files it was made from change,
+    so anything binned more coarsely than the cache (the binning preview,
+    acceptance ratios, angle plots) comes from merging fine bins rather than
+    reading events again.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory) / "histograms"
+
+    def mass(self, file_type, file_paths, step_size="100 MB", rebuild=False):
+        cache_path = self.directory / f"{file_type}_mass.npz"
+        cache = None if rebuild else load_cached_arrays(cache_path, file_paths)
+        if cache is not None:
+            return MassHistogram(int(cache['start']), cache['counts'])
+        histogram = mass_histogram(file_paths, step_size)
+        save_cached_arrays(cache_path, file_paths, {"start": np.array(histogram.start), "counts": histogram.counts})
+        return histogram
+
+    def angles(self, file_type, i_bin, file_paths, step_size="100 MB", rebuild=False):
+        cache_path = self.directory / f"{file_type}_{i_bin}.npz"
+        cache = None if rebuild else load_cached_arrays(cache_path, file_paths)
+        if cache is not None:
+            return cache
+        histograms = angle_histograms(file_paths, step_size)
+        save_cached_arrays(cache_path, file_paths, histograms)
+        return histograms
@@ -0,0 +1,92 @@
+import numpy as np
+import awkward as ak
+import uproot
+
+# Four-vectors are (E, Px, Py, Pz) tuples of arrays and three-vectors are
+# (x, y, z) tuples, so whole chunks of events are handled at once
+
+def add_p4(p4s):
+    return tuple(sum(components) for components in zip(*p4s))
+
+def boost_vector(p4):
+    e, px, py, pz = p4
+    return px / e, py / e, pz / e
+
+def lorentz_boost(p4, beta):
+    """
+    Vectorized equivalent of TLorentzRotation(beta) * TLorentzVector
+    """
+    e, px, py, pz = p4
+    bx, by, bz = beta
+    b2 = bx**2 + by**2 + bz**2
+    gamma = 1.0 / np.sqrt(1.0 - b2)
+    bp = bx * px + by * py + bz * pz
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gamma2 = np.where(b2 > 0, (gamma - 1.0) / b2, 0.0)
+    return (gamma * (e + bp),
+            px + gamma2 * bp * bx + gamma * bx * e,
+            py + gamma2 * bp * by + gamma * by * e,
+            pz + gamma2 * bp * bz + gamma * bz * e)
+
+def negate(v):
+    return tuple(-component for component in v)
+
+def dot(u, v):
+    return sum(a * b for a, b in zip(u, v))
+
+def cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1],
+            u[2] * v[0] - u[0] * v[2],
+            u[0] * v[1] - u[1] * v[0])
+
+def unit(v):
+    # like TVector3::Unit(), zero vectors stay zero
+    mag = np.sqrt(dot(v, v))
+    scale = np.divide(1.0, mag, out=np.ones_like(mag), where=mag > 0)
+    return tuple(component * scale for component in v)
+
+def helicity_angles(beam, recoil, p1, p2):
+    """
+    Returns (cos(theta_HX), phi_HX) of p1 in the helicity frame of the p1 + p2
+    resonance
+
+    The event is boosted to the center-of-momentum frame of the final state and
+    then to the resonance's rest frame, where z is opposite the recoil and y is
+    normal to the production plane (beam x -recoil in the CM frame).
+    """
+    com_beta = negate(boost_vector(add_p4([recoil, p1, p2])))
+    beam = lorentz_boost(beam, com_beta)
+    recoil = lorentz_boost(recoil, com_beta)
+    p1 = lorentz_boost(p1, com_beta)
+    resonance = add_p4([p1, lorentz_boost(p2, com_beta)])
+    res_beta = negate(boost_vector(resonance))
+    recoil_res = lorentz_boost(recoil, res_beta)
+    p1_res = lorentz_boost(p1, res_beta)
+    z = negate(unit(recoil_res[1:]))
+    y = unit(cross(unit(beam[1:]), negate(unit(recoil[1:]))))
+    x = cross(y, z)
+    angles = (dot(p1_res[1:], x), dot(p1_res[1:], y), dot(p1_res[1:], z))
+    mag = np.sqrt(dot(angles, angles))
+    costheta = np.divide(angles[2], mag, out=np.ones_like(mag), where=mag > 0) # TVector3::CosTheta()
+    phi = np.arctan2(angles[1], angles[0])
+    return costheta, phi
+
+def final_state_p4(chunk, index):
+    return tuple(ak.to_numpy(chunk[f"{component}_FinalState"][:, index]).astype(float)
+                 for component in ("E", "Px", "Py", "Pz"))
+
+def iterate_angles(file_paths, step_size="100 MB"):
+    """
+    Yields the helicity angles (of the first daughter, final state 1, with
+    final state 0 as the recoil) and weights of the events in the given flat
+    trees, one chunk at a time
+    """
+    branches = ["Weight", "E_Beam", "Px_Beam", "Py_Beam", "Pz_Beam",
+                "E_FinalState", "Px_FinalState", "Py_FinalState", "Pz_FinalState"]
+    for file_path in file_paths:
+        with uproot.open(file_path) as tfile:
+            for chunk in tfile['kin'].iterate(branches, step_size=step_size, library='ak'):
+                beam = tuple(ak.to_numpy(chunk[f"{component}_Beam"]).astype(float)
+                             for component in ("E", "Px", "Py", "Pz"))
+                costheta, phi = helicity_angles(beam, final_state_p4(chunk, 0), final_state_p4(chunk, 1), final_state_p4(chunk, 2))
+                yield {"costheta": costheta, "phi": phi, "weight": ak.to_numpy(chunk["Weight"]).astype(float)}
@@ -0,0 +1,60 @@
+import numpy as np
+
+
+class MultiStart:
+    """
+    Decides when a bin has been fit from enough random starts
+
+    Converged fits are clustered into minima: a fit belongs to a minimum if
+    its likelihood is within likelihood_tolerance of the minimum's best fit
+    and every wave intensity (the "<wave>@int" columns) is within
+    intensity_tolerance of the best fit's, as a fraction of its total
+    intensity. Intensities don't depend on the overall phase, so fits which
+    only differ by one land in the same minimum. A bin is done once its best
+    minimum has been found required times.
+    """
+
+    def __init__(self, required, likelihood_tolerance=0.1, intensity_tolerance=0.01):
+        self.required = required
+        self.likelihood_tolerance = likelihood_tolerance
+        self.intensity_tolerance = intensity_tolerance
+
+    def minima(self, bin_df):
+        """
+        Groups the fits in a bin into minima, returning a list of DataFrames
+        sorted from the best (lowest) likelihood
+        """
+        if 'likelihood' not in bin_df:
+            return []
+        bin_df = bin_df.dropna(subset=['likelihood']).sort_values('likelihood')
+        if bin_df.empty:
+            return []
+        int_columns = [column for column in bin_df.columns if column.endswith("@int") and column.count("@") == 1 and column != "total@int"]
+        likelihoods = bin_df['likelihood'].to_numpy(dtype=float)
+        intensities = bin_df[int_columns].to_numpy(dtype=float)
+        if 'total@int' in bin_df:
+            scales = np.abs(bin_df['total@int'].to_numpy(dtype=float))
+        else:
+            scales = np.abs(intensities).sum(axis=1)
+        labels = np.full(len(bin_df), -1)
+        n_minima = 0
+        for i in range(len(bin_df)):
+            if labels[i] >= 0:
+                continue
+            # the best unassigned fit starts a new minimum
+            same = ((labels < 0)
+                    & (np.abs(likelihoods - likelihoods[i]) <= self.likelihood_tolerance)
+                    & np.all(np.abs(intensities - intensities[i]) <= self.intensity_tolerance * max(scales[i], 1e-12), axis=1))
+            labels[same] = n_minima
+            n_minima += 1
+        return [bin_df[labels == label] for label in range(n_minima)]
+
+    def reproduced(self, bin_df):
+        """
+        The number of fits in the best minimum of a bin
+        """
+        minima = self.minima(bin_df)
+        return len(minima[0]) if minima else 0
+
+    def converged(self, bin_df):
+        return self.reproduced(bin_df) >= self.required
@@ -0,0 +1,354 @@
+import os
+import time
+import json
+import shutil
+import multiprocessing
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+KEY_COLUMNS = ["bin", "iteration"]
+COMPLEX_SUFFIXES = ("#re", "#im")
+
+
+def encode_complex(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Parquet has no complex type, so complex columns are stored as a pair
+    of float columns, <column>#re and <column>#im
+    """
+    for column in [column for column in df.columns if np.iscomplexobj(df[column].to_numpy())]:
+        values = df.pop(column).to_numpy(dtype=complex)
+        df[column + COMPLEX_SUFFIXES[0]] = values.real
+        df[column + COMPLEX_SUFFIXES[1]] = values.imag
+    return df
+
+def decode_complex(df: pd.DataFrame) -> pd.DataFrame:
+    for re_column in [column for column in df.columns if column.endswith(COMPLEX_SUFFIXES[0])]:
+        column = re_column[:-len(COMPLEX_SUFFIXES[0])]
+        im_column = column + COMPLEX_SUFFIXES[1]
+        if im_column in df.columns:
+            df[column] = df.pop(re_column).to_numpy() + 1j * df.pop(im_column).to_numpy()
+    return df
+
+
+class ResultsStore:
+    """
+    Append-only store of collected fit results
+
+    Each store is a directory <study>/results/<name> holding one Parquet
+    partition per bin (bin=<i>/part-<time>.parquet). Every collection pass
+    writes new part files rather than rewriting old ones, and when a
+    (bin, iteration) has been collected more than once, the most recent row
+    wins. Complex columns (like production amplitudes) keep their type.
+
+    The name is the stem of the CSV file older versions of these scripts
+    wrote (like "<config>_results"). If a study only has that CSV, it is
+    read instead, and its rows are imported the first time anything is
+    written (a .legacy_imported marker records that, so they are never
+    imported twice or brought back after clear). key_columns identify a
+    single fit, and must start with "bin".
+    """
+
+    max_parts = 32 # per bin, before the bin is compacted into one file
+
+    def __init__(self, study_dir, name, key_columns=KEY_COLUMNS):
+        self.study_dir = Path(study_dir)
+        self.name = name
+        self.key_columns = list(key_columns)
+        self.path = self.study_dir / "results" / name
+        self.legacy_csv_path = self.study_dir / f"{name}.csv"
+
+    @staticmethod
+    def names(study_dir, pattern="*"):
+        """
+        Names of the stores (and legacy result CSVs) in a study matching a glob pattern
+        """
+        study_dir = Path(study_dir)
+        names = {path.name for path in (study_dir / "results").glob(pattern) if path.is_dir()}
+        names.update(path.stem for path in study_dir.glob(pattern + ".csv"))
+        return sorted(names)
+
+    def exists(self):
+        return bool(self.parts()) or self.legacy_pending()
+
+    def parts(self, bins=None):
+        if bins is None:
+            bin_paths = self.path.glob("bin=*")
+        else:
+            bin_paths = [self.path / f"bin={i_bin}" for i_bin in bins]
+        return [part for bin_path in bin_paths for part in sorted(bin_path.glob("part-*.parquet"))]
+
+    def append(self, records):
+        """
+        Writes a list of result dicts (each with the key columns)
+        """
+        if not records:
+            return
+        self.import_legacy_csv()
+        self.write_parts(encode_complex(pd.DataFrame.from_records(records)))
+
+    @property
+    def legacy_marker_path(self):
+        return self.path / ".legacy_imported"
+
+    def legacy_pending(self):
+        """
+        Whether the legacy CSV still holds the results (it exists, hasn't
+        been imported, and nothing has been written since)
+        """
+        return self.legacy_csv_path.exists() and not self.legacy_marker_path.exists() and not self.parts()
+
+    def import_legacy_csv(self):
+        # carry over results collected before this store existed
+        if self.legacy_pending():
+            legacy_df = self.load_legacy_csv()
+            if len(legacy_df) > 0:
+                self.write_parts(encode_complex(legacy_df))
+            self.mark_legacy_imported()
+
+    def mark_legacy_imported(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.legacy_marker_path.touch()
+
+    def write_parts(self, df):
+        part_name = f"part-{time.time_ns():020d}-{os.getpid()}.parquet"
+        for i_bin, bin_df in df.groupby("bin"):
+            bin_path = self.path / f"bin={i_bin}"
+            bin_path.mkdir(parents=True, exist_ok=True)
+            # write then rename so readers never see a partial file
+            tmp_path = bin_path / ("." + part_name)
+            bin_df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, bin_path / part_name)
+            if len(self.parts([i_bin])) > self.max_parts:
+                self.compact([i_bin])
+
+    def load(self, columns=None, bins=None) -> pd.DataFrame:
+        """
+        Returns the results as a DataFrame sorted by the key columns, reading
+        only the given columns (the key columns are always included)
+        """
+        if self.legacy_pending():
+            return self.load_legacy_csv(columns, bins)
+        parts = self.parts(bins)
+        if not parts:
+            return pd.DataFrame(columns=self.key_columns)
+        frames = []
+        for part in parts:
+            stored_columns = pq.read_schema(part).names
+            if columns is not None:
+                stored_columns = [column for column in stored_columns
+                                  if column in self.key_columns or column in columns
+                                  or (column.endswith(COMPLEX_SUFFIXES) and column[:-3] in columns)]
+            frames.append(pd.read_parquet(part, columns=stored_columns))
+        df = pd.concat(frames, ignore_index=True)
+        df = df.drop_duplicates(subset=self.key_columns, keep='last')
+        return decode_complex(df).sort_values(self.key_columns).reset_index(drop=True)
+
+    def load_legacy_csv(self, columns=None, bins=None) -> pd.DataFrame:
+        if not self.legacy_csv_path.exists():
+            return pd.DataFrame(columns=self.key_columns)
+        df = pd.read_csv(self.legacy_csv_path)
+        df = df.astype({column: complex for column in df.columns if column.endswith("@amp")})
+        if bins is not None:
+            df = df[df['bin'].isin(list(bins))]
+        if columns is not None:
+            df = df[[column for column in df.columns if column in self.key_columns or column in columns]]
+        return df.sort_values(self.key_columns).reset_index(drop=True)
+
+    def keys(self):
+        """
+        The set of keys (like (bin, iteration)) which have been collected
+        """
+        df = self.load(columns=[])
+        return set(zip(*[df[column].astype(int) for column in self.key_columns]))
+
+    def bins(self):
+        return sorted(int(bin_path.name.split("=", 1)[1]) for bin_path in self.path.glob("bin=*"))
+
+    def rewrite_bin(self, i_bin, df):
+        """
+        Replaces every part file in a bin with the (already loaded) rows in df
+        """
+        old_parts = self.parts([i_bin])
+        if len(df) > 0:
+            part_name = f"part-{time.time_ns():020d}-{os.getpid()}.parquet"
+            tmp_path = self.path / f"bin={i_bin}" / ("." + part_name)
+            encode_complex(df).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self.path / f"bin={i_bin}" / part_name)
+        for part in old_parts:
+            part.unlink()
+
+    def compact(self, bins=None):
+        """
+        Rewrites each bin as a single part file with one row per iteration
+        """
+        for i_bin in (self.bins() if bins is None else bins):
+            if len(self.parts([i_bin])) > 1:
+                self.rewrite_bin(i_bin, self.load(bins=[i_bin]))
+
+    def delete(self, keys):
+        """
+        Removes the rows with the given keys (this rewrites the affected bins)
+        """
+        keys = set(keys)
+        for i_bin in sorted({key[0] for key in keys}):
+            df = self.load(bins=[i_bin])
+            if df.empty:
+                continue
+            row_keys = list(zip(*[df[column].astype(int) for column in self.key_columns]))
+            self.rewrite_bin(i_bin, df[[row_key not in keys for row_key in row_keys]])
+
+    def clear(self):
+        """
+        Removes every collected row (a legacy CSV is not imported again)
+        """
+        if self.path.exists():
+            shutil.rmtree(self.path)
+        self.mark_legacy_imported()
+
+    @property
+    def manifest_path(self):
+        return self.path / "manifest.json"
+
+    def load_manifest(self):
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r') as manifest_file:
+            return json.load(manifest_file)
+
+    def save_manifest(self, manifest):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path / ".manifest.json"
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+        os.replace(tmp_path, self.manifest_path)
+
+
+def key_string(key):
+    return "/".join(str(part) for part in key)
+
+def read_fit_safely(read_fit, fit_path, key):
+    """
+    Runs read_fit in a worker, returning (record, None) or (None, error message)
+    """
+    try:
+        return read_fit(fit_path, *key), None
+    except Exception as error:
+        return None, "".join(traceback.format_exception_only(type(error), error)).strip()
+
+def read_fits(to_read, read_fit, jobs):
+    """
+    Reads (key, fit_path) pairs on a process pool, returning the records and
+    failures in the same order as to_read
+    """
+    results = []
+    if jobs == 1 or len(to_read) < 2:
+        for key, fit_path in tqdm(to_read):
+            results.append(read_fit_safely(read_fit, fit_path, key))
+        return results
+    mp_context = multiprocessing.get_context("fork")
+    chunksize = max(1, len(to_read) // (4 * jobs))
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as pool:
+            # map yields in submission order, so the output doesn't depend on which worker finishes first
+            for result in tqdm(pool.map(read_fit_safely, [read_fit] * len(to_read),
+                                        [fit_path for _, fit_path in to_read],
+                                        [key for key, _ in to_read], chunksize=chunksize),
+                               total=len(to_read)):
+                results.append(result)
+    except BrokenProcessPool:
+        # a worker died outright (e.g. a segfault in AmpTools), so nothing after it is trustworthy
+        results.extend([(None, "worker process crashed")] * (len(to_read) - len(results)))
+    return results
+
+def collect_results(store, fit_paths, read_fit, rebuild=False, jobs=None, prune=True):
+    """
+    Brings a store up to date with a set of .fit files
+
+    fit_paths maps each key (like (bin, iteration)) to the .fit file for that
+    fit, and read_fit(fit_path, *key) returns the fit's result dict (it must
+    be picklable, so a module-level function or a functools.partial of one).
+    The store keeps a manifest of the path, size, and modification time
+    behind each row, so only new or changed files are read, and rows whose
+    files have disappeared are removed. With rebuild, everything is read
+    again. With prune=False, fit_paths may be just some of the fits (like
+    the ones which have finished so far) and nothing else is removed.
+
+    Files are read on a pool of jobs processes (default: one per CPU) and
+    rows are written in key order. Files which fail to read are reported and
+    left out of the manifest so they are retried next time.
+
+    Returns the number of fits read and the number of rows removed
+    """
+    if rebuild:
+        store.clear()
+    if jobs is None:
+        jobs = os.cpu_count()
+    manifest = store.load_manifest()
+    current_manifest = {} if prune else dict(manifest)
+    to_read = []
+    for key, fit_path in sorted(fit_paths.items()):
+        stat = Path(fit_path).stat()
+        entry = {"path": str(fit_path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        current_manifest[key_string(key)] = entry
+        if manifest.get(key_string(key)) != entry:
+            to_read.append((key, fit_path))
+    records = []
+    failures = []
+    for (key, fit_path), (record, error) in zip(to_read, read_fits(to_read, read_fit, jobs)):
+        if record is None:
+            failures.append((key, fit_path, error))
+            current_manifest.pop(key_string(key))
+        else:
+            records.append(record)
+    if failures:
+        print(f"Failed to read {len(failures)} fit file(s):")
+        for key, fit_path, error in failures:
+            print(f"    {key_string(key)}: {fit_path}\n        {error}")
+    # rows for failed files are stale too, since the file changed since they were read
+    removed = [tuple(int(part) for part in key.split("/")) for key in manifest if key not in current_manifest]
+    store.delete(removed)
+    store.append(records)
+    store.save_manifest(current_manifest)
+    return len(records), len(removed)
+
+
+class ResultCollector:
+    """
+    Collects fits into a store while their jobs are still running
+
+    collect_jobs can be passed as the on_complete callback of an executor,
+    so each batch of finished fits is read as soon as it is done. finish
+    then brings the store up to date with the complete set of .fit files,
+    which only reads the ones that were missed.
+    """
+
+    def __init__(self, store, read_fit, rebuild=False, jobs=None):
+        if rebuild:
+            store.clear()
+        self.store = store
+        self.read_fit = read_fit
+        self.jobs = jobs
+        self.n_read = 0
+
+    def collect(self, fit_paths):
+        if fit_paths:
+            n_read, _ = collect_results(self.store, fit_paths, self.read_fit, jobs=self.jobs, prune=False)
+            self.n_read += n_read
+
+    def collect_jobs(self, finished_jobs):
+        self.collect({job.key: job.output for job in finished_jobs
+                      if job.key is not None and job.output is not None and Path(job.output).exists()})
+
+    def finish(self, fit_paths):
+        """
+        Returns the total number of fits read and the number of rows removed
+        """
+        n_read, n_removed = collect_results(self.store, fit_paths, self.read_fit, jobs=self.jobs)
+        self.store.compact() # merge the parts written by each batch
+        return self.n_read + n_read, n_removed
@@ -0,0 +1,177 @@
+import re
+import sys
+from pathlib import Path
+import numpy as np
+import ampwrapper.utils as amputils
+
+POL_FILE_TAGS = {"AMO": "AMO", "000": "PARA_0", "045": "PERP_45", "090": "PERP_90", "135": "PARA_135"}
+
+INIT_RE = re.compile(r"(initialize \w+::\w+::)(AMP\S+) polar (@uniform @polaruniform|@uniform 0\.0)(\n| real\n)")
+TAG_RE = re.compile(r"@(\w+)")
+
+
+class FileIndex:
+    """
+    Maps (file type, polarization, bin) to the split file in a study
+
+    Each file type directory (like <study>/DATA) is listed once, the first
+    time it is needed, and its files are grouped by the bin number at the
+    end of their names (<name>_<bin>.root), so finding the file for a bin
+    doesn't scan the directory again.
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.bins = {} # file type -> {bin: [paths]}
+        self.paths = {} # (file type, polarization, bin) -> path
+
+    def scan(self, file_type):
+        if file_type not in self.bins:
+            type_path = self.directory / file_type
+            if not type_path.is_dir():
+                print(amputils.wrap(f"Error locating the {file_type} directory in {self.directory}!"))
+                sys.exit(1)
+            by_bin = {}
+            for file_path in sorted(type_path.iterdir()):
+                _, sep, i_bin = file_path.stem.rpartition("_")
+                if sep:
+                    by_bin.setdefault(i_bin, []).append(file_path)
+            self.bins[file_type] = by_bin
+        return self.bins[file_type]
+
+    def get(self, file_type, i_bin, pol=None):
+        key = (file_type, pol, i_bin)
+        if key not in self.paths:
+            file_paths = self.scan(file_type).get(str(i_bin), [])
+            if pol is not None:
+                file_tag = POL_FILE_TAGS[pol]
+                file_paths = [file_path for file_path in file_paths if file_tag in file_path.name]
+                description = f"{file_type} file with polarization {file_tag}"
+            else:
+                description = f"{file_type} file"
+            if not file_paths:
+                print(amputils.wrap(f"Error locating the {description} for bin {i_bin}!"))
+                sys.exit(1)
+            if len(file_paths) > 1:
+                print(amputils.wrap(f"Warning: More than one file matches the {description} in bin {i_bin}!"))
+            self.paths[key] = file_paths[0]
+        return self.paths[key]
+
+
+class ConfigTemplate:
+    """
+    An AmpTools config with placeholder tags, parsed once and rendered for
+    any number of (bin, iteration) configs
+
+    The tags are:
+        @uniform, @polaruniform: random starting values in [0, 100) and [0, 2pi)
+        @<TYPE>_<POL>: the file of type <TYPE> (a directory in the study) with
+            polarization <POL> (AMO, 000, 045, 090, or 135) in the bin
+        @<TYPE>: the file of type <TYPE> in the bin
+    and "initialize ... polar @uniform ..." lines can instead be started from
+    the production amplitudes of a previous fit. Random values are drawn in
+    the same order as the scripts which used to fill configs in place, so a
+    given seed gives the same starting points.
+    """
+
+    def __init__(self, text, file_index):
+        self.file_index = file_index
+        self.segments = [] # literal text, or (kind, ...) placeholders
+        position = 0
+        for match in INIT_RE.finditer(text):
+            self.segments.extend(self.parse_tags(text, position, match.start()))
+            self.segments.append(("init", match.group(1), match.group(2), match.group(4),
+                                  self.parse_tags(text, match.start(), match.end())))
+            position = match.end()
+        self.segments.extend(self.parse_tags(text, position, len(text)))
+
+    @classmethod
+    def from_file(cls, config_path, file_index):
+        with open(config_path, 'r') as config_file:
+            return cls(config_file.read(), file_index)
+
+    @staticmethod
+    def parse_tags(text, start, end):
+        """
+        Splits text[start:end] into literal text and tag placeholders
+        """
+        segments = []
+        position = start
+        for match in TAG_RE.finditer(text, start, end):
+            tag = match.group(1)
+            if tag in ("uniform", "polaruniform"):
+                segment = ("random", tag)
+            elif tag == "tags" or match.start() == 0 or not text[match.start() - 1].isspace():
+                continue
+            elif "_" in tag:
+                file_type, pol = tag.rsplit("_", 1)
+                if pol not in POL_FILE_TAGS:
+                    print(amputils.wrap(f"Error in parsing configuration file tags!\n{tag}"))
+                    sys.exit(1)
+                segment = ("file", file_type, pol)
+            else:
+                segment = ("file", tag, None)
+            segments.append(text[position:match.start()])
+            segments.append(segment)
+            position = match.end()
+        segments.append(text[position:end])
+        return segments
+
+    def render(self, i_bin, seed_fit=None):
+        """
+        Returns the config text for a bin. seed_fit is a dict of a previous
+        fit's results with "<amplitude>@amp" entries; if it is empty or None,
+        the amplitudes start from random values (using np.random)
+        """
+        if seed_fit:
+            segments = self.segments
+            randoms = {}
+        else:
+            segments = [segment for item in self.segments for segment in (item[4] if self.is_init(item) else [item])]
+            randoms = self.draw_randoms(segments)
+        out = []
+        for segment in segments:
+            if isinstance(segment, str):
+                out.append(segment)
+            elif segment[0] == "random":
+                out.append(next(randoms[segment[1]]) if randoms else f"@{segment[1]}")
+            elif segment[0] == "file":
+                out.append(str(self.file_index.get(segment[1], i_bin, segment[2])))
+            else:
+                _, prefix, amp, suffix, _ = segment
+                value = complex(seed_fit.get(amp + "@amp"))
+                out.append(f"{prefix}{amp} cartesian {np.real(value)} {np.imag(value)} {suffix}")
+        return "".join(out)
+
+    def write(self, config_path, i_bin, seed_fit=None):
+        with open(config_path, 'w') as config_file:
+            config_file.write(self.render(i_bin, seed_fit))
+
+    @staticmethod
+    def is_init(segment):
+        return not isinstance(segment, str) and segment[0] == "init"
+
+    @staticmethod
+    def draw_randoms(segments):
+        # the n-th @uniform and n-th @polaruniform are filled from one pair of draws
+        n_uniform = sum(1 for segment in segments if segment == ("random", "uniform"))
+        n_polar = sum(1 for segment in segments if segment == ("random", "polaruniform"))
+        draws = np.random.uniform(size=(max(n_uniform, n_polar), 2))
+        return {"uniform": iter(str(value) for value in 100.0 * draws[:, 0]),
+                "polaruniform": iter(str(value) for value in 2 * np.pi * draws[:, 1])}
+
+
+BOOTSTRAP_LOOPS = {"data": "LOOPDATAFILE", "bkgnd": "LOOPBKGFILE", "genmc": "LOOPGENFILE", "accmc": "LOOPACCFILE"}
+
+
+def bootstrap_readers(config_text, seeds):
+    """
+    Swaps the ROOTDataReader of each source in seeds ("data", "bkgnd",
+    "genmc", or "accmc") for a ROOTDataReaderBootstrap with the given seed
+    """
+    for source, seed in seeds.items():
+        loop = BOOTSTRAP_LOOPS[source]
+        config_text = re.sub(rf"{source}\s(\w+)\sROOTDataReader\s{loop}",
+                             rf"{source} \1 ROOTDataReaderBootstrap {loop} {seed}",
+                             config_text)
+    return config_text
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+import numpy as np
+import awkward as ak
+import uproot
+from ampwrapper.utils import load_cached_arrays, save_cached_arrays
+
+PADDING = np.iinfo(np.int64).max # sorts after every PDG ID
+
+
+def thrown_tree_name(tfile):
+    return tfile.keys(filter_classname="TTree", cycle=False)[0]
+
+
+class TopologyIndex:
+    """
+    The thrown topology (sorted Thrown__PID) of every event in a thrown tree
+
+    Each distinct topology gets a code (its position in topologies) and
+    codes[i] is the code of entry i, so finding or counting the events of
+    any number of topologies doesn't read the tree again. The index is built
+    in one pass over Thrown__PID and saved to a sidecar file
+    (<tree>.topologies.npz) which is reused until the tree changes.
+    """
+
+    def __init__(self, topologies, codes):
+        self.topologies = [tuple(topology) for topology in topologies]
+        self.codes = np.asarray(codes)
+        self.counts = np.bincount(self.codes, minlength=len(self.topologies))
+
+    @classmethod
+    def build(cls, path, step_size="100 MB"):
+        lookup = {} # topology -> code
+        codes = []
+        with uproot.open(path) as tfile:
+            ttree = tfile[thrown_tree_name(tfile)]
+            for chunk in ttree.iterate(["Thrown__PID"], step_size=step_size, library='ak'):
+                codes.append(topology_codes(chunk["Thrown__PID"], lookup))
+        codes = np.concatenate(codes) if codes else np.zeros(0, dtype=np.int32)
+        return cls(sorted(lookup, key=lookup.get), codes)
+
+    @classmethod
+    def load(cls, path, index_dir=None, step_size="100 MB", rebuild=False):
+        """
+        Reads the sidecar index of a thrown tree, building it first if it is
+        missing or out of date
+        """
+        path = Path(path)
+        index_path = (Path(index_dir) if index_dir else path.parent) / f"{path.stem}.topologies.npz"
+        cache = None if rebuild else load_cached_arrays(index_path, [path])
+        if cache is not None:
+            return cls(json.loads(str(cache['topologies'])), cache['codes'])
+        index = cls.build(path, step_size)
+        save_cached_arrays(index_path, [path], {"topologies": np.array(json.dumps(index.topologies)), "codes": index.codes})
+        return index
+
+    def code(self, topology):
+        """
+        The code of a topology (any order of PDG IDs), or None if no event has it
+        """
+        try:
+            return self.topologies.index(tuple(sorted(topology)))
+        except ValueError:
+            return None
+
+    def entries(self, topology):
+        code = self.code(topology)
+        if code is None:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(self.codes == code)
+
+
+def topology_codes(pids, lookup):
+    """
+    Returns the code of each event in a chunk of Thrown__PID, adding new
+    topologies to lookup (topology -> code)
+    """
+    if len(pids) == 0:
+        return np.zeros(0, dtype=np.int32)
+    # sort each event's PIDs and pad them to a regular array, so every topology is one row
+    width = max(int(ak.max(ak.num(pids, axis=1))), 1)
+    rows = ak.to_numpy(ak.fill_none(ak.pad_none(ak.sort(ak.values_astype(pids, np.int64), axis=1), width, clip=True), PADDING))
+    unique_rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+    row_codes = np.empty(len(unique_rows), dtype=np.int32)
+    for i, row in enumerate(unique_rows):
+        topology = tuple(int(pid) for pid in row if pid != PADDING)
+        row_codes[i] = lookup.setdefault(topology, len(lookup))
+    return row_codes[inverse.ravel()]
@@ -0,0 +1,43 @@
+"""
+Helper functions shared by the amptools-* scripts
+
+The helpers live in submodules grouped by what they need:
+    terminal: wrap, the Box styles, and get_logger (standard library only)
+    environment: the active environment, configs, and studies
+    envstore: the SQLite store of an environment's studies and results
+    menus: file/list selectors and the binning preview (terminal UI libraries)
+    files: splitting flat trees, file fingerprints, and array caches (numpy, uproot)
+    slurm: queue checks
+Names are imported from their submodule the first time they are used, so
+"from ampwrapper.utils import get_environment" doesn't load numpy, uproot,
+or PyROOT.
+"""
+import importlib
+
+_SUBMODULE_NAMES = {
+    "terminal": ["Box", "DEFAULT", "BOLD", "DOUBLE", "HBOLD", "VBOLD", "HDOUBLE", "VDOUBLE", "CURVED", "wrap", "get_logger"],
+    "environment": ["get_environment", "get_configs", "AmpToolsConfig", "load_config", "get_config", "get_config_pols",
+                    "get_config_reaction", "get_config_background", "get_study_config", "get_env_store", "load_env"],
+    "envstore": ["EnvironmentStore"],
+    "menus": ["get_binning", "file_selector", "list_selector"],
+    "files": ["split_mass", "split_mass_halld_sim", "get_kin_branch_types", "split_mass_uproot", "hash_file",
+              "file_fingerprint", "fingerprint_matches", "split_and_fingerprint", "split_is_current",
+              "load_cached_arrays", "save_cached_arrays"],
+    "slurm": ["queue_length", "running_length", "check_SLURM"],
+}
+_SUBMODULES = {name: submodule for submodule, names in _SUBMODULE_NAMES.items() for name in names}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    globals()[name] = value # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,149 @@
+import json
+import re
+import sys
+from pathlib import Path
+from ampwrapper.utils.terminal import wrap
+
+_environment_cache = {}
+
+def get_environment() -> Path:
+    config_path = Path.home() / ".amptoolstools"
+    if config_path.exists():
+        mtime = config_path.stat().st_mtime_ns
+        if _environment_cache.get('mtime') != mtime:
+            with open(config_path, 'r') as config_file:
+                config = json.load(config_file)
+            _environment_cache['mtime'] = mtime
+            _environment_cache['path'] = Path(config['path']).resolve()
+        return _environment_cache['path']
+    else:
+        print(wrap("No active environment found! Use amptools-activate to create one!"))
+        sys.exit(1)
+
+def get_env_store():
+    from ampwrapper.utils.envstore import EnvironmentStore
+    return EnvironmentStore(get_environment())
+
+def load_env() -> dict:
+    """
+    The active environment's metadata ({'studies': {...}, ...})
+    """
+    return get_env_store().load()
+
+_configs_cache = {}
+
+def get_configs() -> dict:
+    config_path = get_environment().parent / "configs"
+    mtime = config_path.stat().st_mtime_ns # changes when a config is added or removed
+    if _configs_cache.get('key') != (config_path, mtime):
+        _configs_cache['key'] = (config_path, mtime)
+        _configs_cache['configs'] = {f.stem: f for f in config_path.iterdir() if f.suffix == ".cfg"}
+    return dict(_configs_cache['configs'])
+
+
+class AmpToolsConfig:
+    """
+    The parts of an AmpTools .cfg file the scripts need, parsed once
+
+    reaction is the name of the (first) reaction, polarizations are the
+    polarization tags of the LOOPDATAFILE loop (like "000" from @DATA_000),
+    and dataset_polarizations are the tags of multi-dataset configs (like
+    "000_S17" from @DATA_000_S17). sums, amplitudes, and constraints are
+    lists of the names in the file, parameters and defines map names to the
+    rest of their line, loops map loop names to their values, and
+    data_readers maps each data type (data, genmc, accmc, bkgnd) to its
+    (reaction, reader, arguments) lines.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'r') as config_file:
+            self.content = config_file.read()
+        self.reaction = None
+        self.sums = []
+        self.amplitudes = []
+        self.constraints = []
+        self.parameters = {}
+        self.defines = {}
+        self.loops = {}
+        self.data_readers = {}
+        for line in self.content.splitlines():
+            tokens = line.split("#", 1)[0].split()
+            if not tokens:
+                continue
+            keyword, args = tokens[0], tokens[1:]
+            if keyword == "reaction" and args and self.reaction is None:
+                self.reaction = args[0]
+            elif keyword == "sum" and len(args) >= 2:
+                self.sums.extend(f"{args[0]}::{sum_name}" for sum_name in args[1:])
+            elif keyword == "amplitude" and args:
+                if args[0] not in self.amplitudes:
+                    self.amplitudes.append(args[0])
+            elif keyword == "constrain":
+                self.constraints.append(args)
+            elif keyword == "parameter" and args:
+                self.parameters[args[0]] = args[1:]
+            elif keyword == "define" and args:
+                self.defines[args[0]] = args[1:]
+            elif keyword == "loop" and args:
+                self.loops[args[0]] = args[1:]
+            elif keyword in ("data", "genmc", "accmc", "bkgnd") and len(args) >= 2:
+                self.data_readers.setdefault(keyword, []).append((args[0], args[1], args[2:]))
+        self.background = "bkgnd" in self.content
+        regex = re.compile("loop LOOPDATAFILE (?:@DATA_(\S{3})\s)(?:@DATA_(\S{3})\s)?(?:@DATA_(\S{3})\s)?(?:@DATA_(\S{3})?\s)?(?:@DATA_(\S{3})\s)?")
+        m = regex.search(self.content)
+        self.polarizations = [g for g in m.groups() if g is not None] if m else []
+        self.dataset_polarizations = re.findall("@DATA_(\S{3}_\S{3})\s", self.content)
+
+    def pols(self, multi_datasets=False):
+        return list(self.dataset_polarizations if multi_datasets else self.polarizations)
+
+_config_cache = {}
+
+def load_config(path: Path) -> AmpToolsConfig:
+    """
+    Parses a .cfg file, reusing the parsed object until the file changes
+    """
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    if path not in _config_cache or _config_cache[path][0] != mtime:
+        _config_cache[path] = (mtime, AmpToolsConfig(path))
+    return _config_cache[path][1]
+
+def get_config(name: str) -> AmpToolsConfig:
+    return load_config(get_configs()[name])
+
+def get_config_pols(name: str, multi_datasets = False):
+    return get_config(name).pols(multi_datasets)
+
+def get_config_reaction(name: str) -> str:
+    return get_config(name).reaction
+
+def get_config_background(name: str) -> bool:
+    return get_config(name).background
+
+def get_study_config(study=None, config=None):
+    from ampwrapper.utils.menus import list_selector
+    env = load_env()
+    config_keys = list(get_configs().keys())
+    study_keys = list(env['studies'].keys())
+    if study:
+        study_dict = env['studies'][study]
+        valid_configs = [config_name for config_name in config_keys if get_config_background(config_name) == study_dict['background']]
+        # maybe more to validate number of files/polarization stuff?
+        if config:
+            if not config in valid_configs:
+                print(wrap(f"{config} is not a valid configuration file for this study. Choose one of the following: {', '.join(valid_configs)}"))
+                sys.exit(1)
+        else:
+            config, _ = list_selector(valid_configs, title="Select a fit configuration:")
+    else:
+        if config:
+            valid_studies = [study_name for study_name in study_keys if env['studies'][study_name]['background'] == get_config_background(config)]
+            study, _ = list_selector(valid_studies, title="Select a study:")
+        else:
+            study, _ = list_selector(study_keys, title="Select a study:")
+            study_dict = env['studies'][study]
+            valid_configs = [config_name for config_name in config_keys if get_config_background(config_name) == study_dict['background']]
+            config, _ = list_selector(valid_configs, title="Select a fit configuration:")
+    return study, config
@@ -0,0 +1,151 @@
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+RESULT_LISTS = ("results", "bootstraps") # study fields which are lists of config names
+RESULT_MAPS = ("multistart",) # study fields which map config names to values
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS env (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS studies (name TEXT PRIMARY KEY, study TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS study_results (
+    study TEXT NOT NULL,
+    field TEXT NOT NULL,
+    config TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (study, field, config)
+);
+"""
+
+
+class EnvironmentStore:
+    """
+    The environment's metadata (its studies and what has been fit in them),
+    kept in an SQLite database next to the .env.json file
+
+    Every study is one row and every result (a config in a study's
+    "results" or "bootstraps", or an entry of its "multistart" summaries)
+    is its own row, so a script only writes the rows it changes. Writes
+    take SQLite's write lock (waiting up to timeout seconds for other
+    writers), so concurrent runs on one environment can't overwrite each
+    other's results. Reads open the database read-only and never wait for
+    a full parse of the environment.
+
+    The first time an environment is opened, the contents of an existing
+    .env.json are imported.
+    """
+
+    def __init__(self, env_path, timeout=60.0):
+        self.env_path = Path(env_path)
+        self.db_path = self.env_path.with_name(".env.sqlite")
+        self.timeout = timeout
+
+    def connect(self, readonly=False):
+        if readonly and self.db_path.exists():
+            connection = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True, timeout=self.timeout)
+            if connection.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return connection
+            connection.close()
+        connection = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+        with self.transaction(connection):
+            if connection.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        connection.execute(statement)
+                self.import_json(connection)
+                connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return connection
+
+    @staticmethod
+    @contextmanager
+    def transaction(connection):
+        # IMMEDIATE takes the write lock up front, so a read-modify-write can't interleave with another writer
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @contextmanager
+    def writing(self):
+        connection = self.connect()
+        try:
+            with self.transaction(connection):
+                yield connection
+        finally:
+            connection.close()
+
+    @contextmanager
+    def reading(self):
+        connection = self.connect(readonly=True)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def import_json(self, connection):
+        if not self.env_path.exists():
+            return
+        with open(self.env_path, 'r') as env_file:
+            text = env_file.read()
+        env = json.loads(text) if text.strip() else {}
+        for name, study in env.pop('studies', {}).items():
+            self.write_study(connection, name, study)
+        for key, value in env.items():
+            connection.execute("INSERT OR REPLACE INTO env VALUES (?, ?)", (key, json.dumps(value)))
+
+    @staticmethod
+    def write_study(connection, name, study):
+        study = dict(study)
+        connection.execute("DELETE FROM study_results WHERE study = ?", (name,))
+        for field in RESULT_LISTS:
+            for config in study.pop(field, None) or []:
+                connection.execute("INSERT OR IGNORE INTO study_results VALUES (?, ?, ?, NULL)", (name, field, config))
+        for field in RESULT_MAPS:
+            for config, value in (study.pop(field, None) or {}).items():
+                connection.execute("INSERT OR REPLACE INTO study_results VALUES (?, ?, ?, ?)", (name, field, config, json.dumps(value)))
+        # an upsert rather than INSERT OR REPLACE keeps the study's rowid, and so its place in the order
+        connection.execute("INSERT INTO studies VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET study = excluded.study", (name, json.dumps(study)))
+
+    def load(self):
+        """
+        The whole environment as the dict .env.json used to hold
+        """
+        with self.reading() as connection:
+            env = {key: json.loads(value) for key, value in connection.execute("SELECT key, value FROM env")}
+            studies = {name: json.loads(study) for name, study in connection.execute("SELECT name, study FROM studies ORDER BY rowid")}
+            for name, field, config, value in connection.execute("SELECT study, field, config, value FROM study_results ORDER BY rowid"):
+                if name not in studies:
+                    continue
+                if value is None:
+                    studies[name].setdefault(field, []).append(config)
+                else:
+                    studies[name].setdefault(field, {})[config] = json.loads(value)
+        env['studies'] = studies
+        return env
+
+    def save_study(self, name, study):
+        """
+        Adds or replaces a study (including its results)
+        """
+        with self.writing() as connection:
+            self.write_study(connection, name, study)
+
+    def add_result(self, study, field, config, value=None):
+        """
+        Records config under a study's field, a list (like "results") if
+        value is None and otherwise a map (like "multistart") from config to
+        value, without touching any other study or result
+        """
+        if (value is None and field not in RESULT_LISTS) or (value is not None and field not in RESULT_MAPS):
+            raise ValueError(f"{field} is not a study result {'list' if value is None else 'map'}")
+        with self.writing() as connection:
+            if value is None:
+                connection.execute("INSERT OR IGNORE INTO study_results VALUES (?, ?, ?, NULL)", (study, field, config))
+            else:
+                connection.execute("INSERT INTO study_results VALUES (?, ?, ?, ?) ON CONFLICT (study, field, config) DO UPDATE SET value = excluded.value",
+                                   (study, field, config, json.dumps(value)))
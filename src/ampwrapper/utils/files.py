@@ -0,0 +1,174 @@
+import os
+import json
+import hashlib
+import subprocess
+from pathlib import Path
+import numpy as np
+import uproot
+
+def split_mass(flattree: Path, output_dir: Path, low: float, high: float, nbins: int, manager):
+    import ROOT # only this (slow) splitter needs PyROOT, and loading it takes seconds
+    tfile_in = ROOT.TFile.Open(str(flattree), "READ")
+    ttree_in = tfile_in.Get('kin')
+    bin_edges = np.linspace(low, high, nbins+1)
+    pbar = manager.counter(total=nbins, desc=flattree.stem, unit='bin', leave=False)
+    for ibin in pbar(range(nbins)):
+        output_path = output_dir / (flattree.stem + f"_{ibin}.root")
+        if output_path.exists():
+            output_path.unlink() # delete existing output (overwrite)
+        tfile_out = ROOT.TFile.Open(str(output_path), "RECREATE")
+        ttree_out = ttree_in.CloneTree(0)
+        for event in ttree_in:
+            if bin_edges[ibin] < event.M_FinalState < bin_edges[ibin + 1]:
+                ttree_out.Fill()
+        tfile_out.Write()
+        tfile_out.Close()
+    tfile_in.Close()
+
+def split_mass_halld_sim(flattree: Path, output_dir: Path, low: float, high: float, nbins: int, manager):
+    home = os.getcwd()
+    os.chdir(output_dir)
+    subprocess.run(["split_mass", str(flattree), flattree.stem, str(low), str(high), str(nbins)])
+    os.chdir(home)
+                    
+
+def get_kin_branch_types(ttree):
+    """
+    Returns the branch types (in uproot.mktree format) of a flat tree along with
+    a dict which maps each jagged branch to the name of its counter branch
+    """
+    branch_types = {}
+    counter_names = {}
+    for branch in ttree.branches:
+        interpretation = branch.interpretation
+        if isinstance(interpretation, uproot.AsJagged):
+            dtype = interpretation.content.to_dtype.newbyteorder('=')
+            branch_types[branch.name] = f"var * {dtype}"
+            count_branch = branch.count_branch
+            counter_names[branch.name] = count_branch.name if count_branch is not None else "n" + branch.name
+        else:
+            branch_types[branch.name] = interpretation.to_dtype.newbyteorder('=')
+    for counter_name in counter_names.values():
+        branch_types.pop(counter_name, None) # uproot writes the counters itself
+    return branch_types, counter_names
+
+def split_mass_uproot(flattree: Path, output_dir: Path, edges, manager=None, step_size="100 MB"):
+    """
+    Splits a flat tree into mass bins in a single pass
+
+    Each chunk of the input is binned in M_FinalState with np.digitize and
+    written to every output file at once, so the input is only read once no
+    matter how many bins there are. Events outside the edges are dropped.
+    Outputs are named <stem>_<ibin>.root (like the halld_sim split_mass) and
+    keep the input's kin schema.
+    """
+    edges = np.asarray(edges, dtype=float)
+    nbins = len(edges) - 1
+    output_paths = [output_dir / (flattree.stem + f"_{ibin}.root") for ibin in range(nbins)]
+    with uproot.open(flattree) as tfile_in:
+        ttree_in = tfile_in['kin']
+        branch_types, counter_names = get_kin_branch_types(ttree_in)
+        pbar = None
+        if manager:
+            pbar = manager.counter(total=ttree_in.num_entries, desc=flattree.stem, unit='events', leave=False)
+        tfiles_out = [uproot.recreate(output_path) for output_path in output_paths] # overwrites existing output
+        try:
+            ttrees_out = [tfile_out.mktree('kin', branch_types, title=ttree_in.title,
+                                           counter_name=lambda counted: counter_names[counted])
+                          for tfile_out in tfiles_out]
+            for chunk in ttree_in.iterate(list(branch_types), step_size=step_size, library='ak'):
+                masses = chunk['M_FinalState'].to_numpy()
+                ibins = np.digitize(masses, edges) - 1 # NaNs land past the last edge
+                in_range = (ibins >= 0) & (ibins < nbins)
+                # sort the chunk by bin once, then each bin is a contiguous slice
+                order = np.flatnonzero(in_range)
+                order = order[np.argsort(ibins[order], kind='stable')]
+                bin_counts = np.bincount(ibins[order], minlength=nbins)
+                bin_stops = np.cumsum(bin_counts)
+                bin_starts = bin_stops - bin_counts
+                for ibin in np.flatnonzero(bin_stops > bin_starts):
+                    indices = order[bin_starts[ibin]:bin_stops[ibin]]
+                    ttrees_out[ibin].extend({branch_name: chunk[branch_name][indices] for branch_name in branch_types})
+                if pbar:
+                    pbar.update(len(chunk))
+        finally:
+            for tfile_out in tfiles_out:
+                tfile_out.close()
+        if pbar:
+            pbar.close()
+    return output_paths
+
+def hash_file(path: Path, block_size=1 << 20) -> str:
+    file_hash = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+def file_fingerprint(path: Path, with_hash=True) -> dict:
+    stat = path.stat()
+    fingerprint = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+    if with_hash:
+        fingerprint["hash"] = hash_file(path)
+    return fingerprint
+
+def fingerprint_matches(path: Path, fingerprint: dict) -> bool:
+    """
+    Checks a file against a stored fingerprint, only hashing the file if its
+    size matches but its modification time has changed
+    """
+    if not path.exists():
+        return False
+    current = file_fingerprint(path, with_hash=False)
+    if current["size"] != fingerprint["size"]:
+        return False
+    if current["mtime"] == fingerprint["mtime"]:
+        return True
+    if "hash" in fingerprint and hash_file(path) == fingerprint["hash"]:
+        fingerprint["mtime"] = current["mtime"] # same contents, skip the hash next time
+        return True
+    return False
+
+def split_and_fingerprint(flattree: Path, output_dir: Path, edges, manager=None) -> dict:
+    """
+    Runs split_mass_uproot and returns a record of the input, edges, and outputs
+    which split_is_current can later check against
+    """
+    output_paths = split_mass_uproot(flattree, output_dir, edges, manager=manager)
+    return {"input": file_fingerprint(flattree),
+            "edges": [float(edge) for edge in edges],
+            "outputs": {str(output_path): file_fingerprint(output_path, with_hash=False) for output_path in output_paths}}
+
+def split_is_current(record, flattree: Path, edges) -> bool:
+    if not record or record["edges"] != [float(edge) for edge in edges]:
+        return False
+    if not all(fingerprint_matches(Path(output_path), fingerprint)
+               for output_path, fingerprint in record["outputs"].items()):
+        return False
+    return fingerprint_matches(flattree, record["input"])
+
+def load_cached_arrays(cache_path: Path, sources) -> dict:
+    """
+    Loads the arrays saved by save_cached_arrays, or returns None if there is
+    no cache or it was made from different (or since modified) source files
+    """
+    if not cache_path.exists():
+        return None
+    with np.load(cache_path) as cache:
+        fingerprints = json.loads(str(cache["sources"]))
+        if list(fingerprints) != [str(source) for source in sources]:
+            return None
+        if not all(fingerprint_matches(Path(source), fingerprint) for source, fingerprint in fingerprints.items()):
+            return None
+        return {name: cache[name] for name in cache.files if name != "sources"}
+
+def save_cached_arrays(cache_path: Path, sources, arrays: dict):
+    """
+    Saves arrays to cache_path (a .npz file) along with fingerprints of the
+    files they were made from
+    """
+    fingerprints = {str(source): file_fingerprint(Path(source), with_hash=False) for source in sources}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = cache_path.with_name(cache_path.stem + ".partial.npz")
+    np.savez(partial_path, sources=np.array(json.dumps(fingerprints)), **arrays)
+    partial_path.replace(cache_path) # never leave a half-written cache behind
@@ -0,0 +1,21 @@
+import os
+import subprocess
+
+def queue_length(job_names):
+    jobs = subprocess.run(['squeue', '-h', '-u', os.getlogin(), '-o', '%j'], stdout=subprocess.PIPE).stdout.decode('utf-8').splitlines()
+    job_names = set(job_names)
+    matching_jobs = [job for job in jobs if job in job_names]
+    return len(matching_jobs)
+
+def running_length(job_names):
+    jobs = subprocess.run(['squeue', '-h', '-u', os.getlogin(), '-o', '%j', '-t', 'running'], stdout=subprocess.PIPE).stdout.decode('utf-8').splitlines()
+    job_names = set(job_names)
+    matching_jobs = [job for job in jobs if job in job_names]
+    return len(matching_jobs)
+
+def check_SLURM(job_names):
+    if not isinstance(job_names, list):
+        job_names = [job_names]
+    n_jobs_in_queue = queue_length(job_names)
+    n_jobs_running = running_length(job_names)
+    return n_jobs_running, n_jobs_in_queue